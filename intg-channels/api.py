@@ -9,159 +9,252 @@ API reference: https://getchannels.com/api/
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+import asyncio
 import logging
 from typing import Any
 
 import aiohttp
+import orjson
 
 _LOG = logging.getLogger(__name__)
 
 DEFAULT_PORT = 57000
-REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=5)
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=2)
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_BACKOFF = 0.2
+
+_SUPPORTED_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+_API_STATUS = "/api/status"
+_API_FAVORITE_CHANNELS = "/api/favorite_channels"
+_API_NOTIFY = "/api/notify"
+_CMD_TOGGLE_PAUSE = "/api/toggle_pause"
+_CMD_PAUSE = "/api/pause"
+_CMD_RESUME = "/api/resume"
+_CMD_STOP = "/api/stop"
+_CMD_SEEK = "/api/seek"
+_CMD_SEEK_FORWARD = "/api/seek_forward"
+_CMD_SEEK_BACKWARD = "/api/seek_backward"
+_CMD_SKIP_FORWARD = "/api/skip_forward"
+_CMD_SKIP_BACKWARD = "/api/skip_backward"
+_CMD_TOGGLE_MUTE = "/api/toggle_mute"
+_CMD_TOGGLE_PIP = "/api/toggle_pip"
+_CMD_CHANNEL_UP = "/api/channel_up"
+_CMD_CHANNEL_DOWN = "/api/channel_down"
+_CMD_PREVIOUS_CHANNEL = "/api/previous_channel"
+_CMD_PLAY_CHANNEL = "/api/play/channel"
+_CMD_PLAY_RECORDING = "/api/play/recording"
+_CMD_NAVIGATE = "/api/navigate"
+_CMD_TOGGLE_CC = "/api/toggle_cc"
+_CMD_TOGGLE_RECORD = "/api/toggle_record"
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize request bodies with orjson (aiohttp expects a str)."""
+    return orjson.dumps(obj).decode()
 
 
 class ChannelsClient:
     """Async HTTP client for the Channels app API."""
 
-    def __init__(self, host: str, port: int = DEFAULT_PORT) -> None:
+    def __init__(
+        self,
+        host: str,
+        port: int = DEFAULT_PORT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        connector: aiohttp.BaseConnector | None = None,
+    ) -> None:
+        """
+        Create a client for the Channels app at host:port.
+
+        :param connector: Optional connection pool shared with other clients.
+            It is left open when the client closes. Without one, the client
+            creates and owns a small pool of its own.
+        """
         self.host = host
         self.port = port
-
-    @property
-    def _base_url(self) -> str:
-        return f"http://{self.host}:{self.port}"
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._base_url = f"http://{host}:{port}"
+        self._connector = connector
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+
+        The session is created lazily so it binds to the running event loop,
+        and is reused across requests so keep-alive connections are pooled.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                base_url=self._base_url,
+                timeout=REQUEST_TIMEOUT,
+                connector=self._connector
+                or aiohttp.TCPConnector(limit=4, keepalive_timeout=75),
+                connector_owner=self._connector is None,
+                json_serialize=_json_dumps,
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the HTTP session and any connection pool the client owns."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def _request(
         self, method: str, path: str, params: dict[str, Any] | None = None
     ) -> dict[str, Any]:
-        """Make an HTTP request and return the parsed JSON response."""
-        url = self._base_url + path
-        try:
-            async with aiohttp.ClientSession(timeout=REQUEST_TIMEOUT) as session:
-                if method == "GET":
-                    async with session.get(url) as response:
-                        return await response.json(content_type=None)
-                elif method == "POST":
-                    async with session.post(url, json=params) as response:
-                        return await response.json(content_type=None)
-                elif method == "PUT":
-                    async with session.put(url, json=params) as response:
-                        return await response.json(content_type=None)
-                elif method == "DELETE":
-                    async with session.delete(url) as response:
-                        return await response.json(content_type=None)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-        except aiohttp.ClientResponseError:
-            return {"status": "error"}
-        except TimeoutError:
-            return {"status": "offline"}
-        except aiohttp.ClientError:
-            return {"status": "offline"}
-
-    async def _command(self, named_command: str) -> dict[str, Any]:
-        """Send a named control command."""
-        return await self._request("POST", f"/api/{named_command}")
+        """
+        Make an HTTP request and return the parsed JSON response.
+
+        Transient failures (connection errors, 502/503/504 responses and, for
+        GET requests, timeouts) are retried up to max_retries times with
+        exponential backoff. Commands are only retried when the connection
+        could not be opened, since after a timeout or a dropped connection the
+        app may already have acted on them.
+        """
+        if method not in _SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        session = self._get_session()
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            can_retry = attempt < self.max_retries
+            try:
+                async with session.request(
+                    method, path, json=params if method != "GET" else None
+                ) as response:
+                    if response.status in _RETRY_STATUSES:
+                        if can_retry:
+                            continue
+                        response.raise_for_status()
+                    body = await response.read()
+                    return orjson.loads(body) if body.strip() else None
+            except aiohttp.ClientResponseError:
+                return {"status": "error"}
+            except TimeoutError:
+                if can_retry and method == "GET":
+                    continue
+                return {"status": "offline"}
+            except aiohttp.ClientConnectionError as err:
+                if can_retry and (
+                    method == "GET" or isinstance(err, aiohttp.ClientConnectorError)
+                ):
+                    continue
+                return {"status": "offline"}
+            except aiohttp.ClientError:
+                return {"status": "offline"}
+
+        return {"status": "offline"}
+
+    async def _command(self, path: str) -> dict[str, Any]:
+        """Send a control command."""
+        return await self._request("POST", path)
 
     # --- Status ---
 
     async def status(self) -> dict[str, Any]:
         """Return the current playback state."""
-        return await self._request("GET", "/api/status")
+        return await self._request("GET", _API_STATUS)
 
     async def favorite_channels(self) -> list[dict[str, Any]]:
         """Return the list of favorite channels."""
-        response = await self._request("GET", "/api/favorite_channels")
+        response = await self._request("GET", _API_FAVORITE_CHANNELS)
         return response if isinstance(response, list) else []
 
     # --- Playback control ---
 
     async def toggle_pause(self) -> dict[str, Any]:
         """Toggle paused state."""
-        return await self._command("toggle_pause")
+        return await self._command(_CMD_TOGGLE_PAUSE)
 
     async def pause(self) -> dict[str, Any]:
         """Pause playback."""
-        return await self._command("pause")
+        return await self._command(_CMD_PAUSE)
 
     async def resume(self) -> dict[str, Any]:
         """Resume playback."""
-        return await self._command("resume")
+        return await self._command(_CMD_RESUME)
 
     async def stop(self) -> dict[str, Any]:
         """Stop playback."""
-        return await self._command("stop")
+        return await self._command(_CMD_STOP)
 
     async def seek(self, seconds: int) -> dict[str, Any]:
         """Seek by a relative number of seconds (positive or negative)."""
-        return await self._command(f"seek/{seconds or 0}")
+        return await self._command(f"{_CMD_SEEK}/{seconds or 0}")
 
     async def seek_forward(self) -> dict[str, Any]:
         """Seek forward."""
-        return await self._command("seek_forward")
+        return await self._command(_CMD_SEEK_FORWARD)
 
     async def seek_backward(self) -> dict[str, Any]:
         """Seek backward."""
-        return await self._command("seek_backward")
+        return await self._command(_CMD_SEEK_BACKWARD)
 
     async def skip_forward(self) -> dict[str, Any]:
         """Skip forward to the next chapter mark."""
-        return await self._command("skip_forward")
+        return await self._command(_CMD_SKIP_FORWARD)
 
     async def skip_backward(self) -> dict[str, Any]:
         """Skip backward to the previous chapter mark."""
-        return await self._command("skip_backward")
+        return await self._command(_CMD_SKIP_BACKWARD)
 
     # --- Audio ---
 
     async def toggle_mute(self) -> dict[str, Any]:
         """Toggle mute state."""
-        return await self._command("toggle_mute")
+        return await self._command(_CMD_TOGGLE_MUTE)
 
     async def toggle_pip(self) -> dict[str, Any]:
         """Toggle Picture in Picture."""
-        return await self._command("toggle_pip")
+        return await self._command(_CMD_TOGGLE_PIP)
 
     # --- Channels ---
 
     async def channel_up(self) -> dict[str, Any]:
         """Change to the next channel."""
-        return await self._command("channel_up")
+        return await self._command(_CMD_CHANNEL_UP)
 
     async def channel_down(self) -> dict[str, Any]:
         """Change to the previous channel."""
-        return await self._command("channel_down")
+        return await self._command(_CMD_CHANNEL_DOWN)
 
     async def previous_channel(self) -> dict[str, Any]:
         """Jump back to the last channel."""
-        return await self._command("previous_channel")
+        return await self._command(_CMD_PREVIOUS_CHANNEL)
 
     async def play_channel(self, channel_number: int | str) -> dict[str, Any]:
         """Tune to a specific channel number."""
-        return await self._command(f"play/channel/{channel_number}")
+        return await self._command(f"{_CMD_PLAY_CHANNEL}/{channel_number}")
 
     async def play_recording(self, recording_id: int | str) -> dict[str, Any]:
         """Play a specific recording by ID."""
-        return await self._command(f"play/recording/{recording_id}")
+        return await self._command(f"{_CMD_PLAY_RECORDING}/{recording_id}")
 
     # --- UI ---
 
     async def navigate(self, section: str) -> dict[str, Any]:
         """Navigate to a named section of the app."""
-        return await self._command(f"navigate/{section}")
+        return await self._command(f"{_CMD_NAVIGATE}/{section}")
 
     async def notify(self, title: str, message: str) -> dict[str, Any]:
         """Display an in-app notification."""
         return await self._request(
-            "POST", "/api/notify", {"title": title, "message": message}
+            "POST", _API_NOTIFY, {"title": title, "message": message}
         )
 
     # --- Captions / Recording ---
 
     async def toggle_cc(self) -> dict[str, Any]:
         """Toggle closed captions."""
-        return await self._command("toggle_cc")
+        return await self._command(_CMD_TOGGLE_CC)
 
     async def toggle_record(self) -> dict[str, Any]:
         """Toggle recording of the current program."""
-        return await self._command("toggle_record")
+        return await self._command(_CMD_TOGGLE_RECORD)
@@ -10,8 +10,26 @@ from enum import StrEnum
 
 DEFAULT_PORT = 57000
 
+# Separators in IPv4/IPv6 addresses that are replaced when deriving identifiers
+_DOT_TO_UNDERSCORE = str.maketrans({".": "_", ":": "_"})
 
-@dataclass
+
+def make_identifier(address: str) -> str:
+    """
+    Derive a device identifier from an IP address or hostname.
+
+    Discovery and setup must both use this so the same device always maps to
+    the same identifier.
+
+    :param address: IP address or hostname of the Channels app
+    :return: address with dots and colons replaced by underscores
+    """
+    if "." in address or ":" in address:
+        return address.translate(_DOT_TO_UNDERSCORE)
+    return address
+
+
+@dataclass(slots=True)
 class DeviceConfig:
     """Configuration for a Channels app device."""
 
@@ -7,11 +7,15 @@ It uses a PollingDevice to periodically query the Channels API for status update
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+import asyncio
 import logging
 import os
+import time
 from asyncio import AbstractEventLoop
-from typing import Any
+from functools import partial
+from typing import Any, Awaitable, Callable
 
+import aiohttp
 from api import ChannelsClient
 from const import DeviceConfig
 from ucapi import media_player
@@ -27,6 +31,26 @@ _LOG = logging.getLogger(__name__)
 # Default polling interval in seconds
 POLL_INTERVAL = int(os.getenv("UC_CHANNELS_POLL_INTERVAL", "5"))
 
+# Polling interval while playing and the user has recently sent a command
+POLL_INTERVAL_ACTIVE = 1.0
+
+# Polling interval while the app is stopped or unreachable
+POLL_INTERVAL_IDLE = 30.0
+
+# How long (in seconds) after a command the device is considered in active use
+ACTIVE_WINDOW = 10.0
+
+# Quiet period after the last command before the status is refreshed, so a
+# burst of button presses results in a single refresh
+COMMAND_REFRESH_DELAY = 0.25
+
+# Quiet period (in seconds) after the last seek request before the seek is
+# sent, so dragging the scrubber results in a single seek to the final position
+SEEK_DEBOUNCE = 0.15
+
+# Status responses younger than this (in seconds) are served from cache
+STATUS_CACHE_TTL = 1.0
+
 # Map Channels status strings to ucapi States
 _CHANNELS_STATE_MAP = {
     "playing": media_player.States.PLAYING,
@@ -36,17 +60,73 @@ _CHANNELS_STATE_MAP = {
     "offline": media_player.States.UNAVAILABLE,
 }
 
+# Map Channels content types to ucapi media types; anything else is a TV show
+_MEDIA_TYPE_MAP = {
+    "movie": media_player.MediaType.VIDEO,
+}
+
+
+class _StatusCache:
+    """
+    Short-lived cache of the Channels status response.
+
+    Concurrent readers share a single in-flight request. Once the cached value
+    has expired, readers arriving while a refresh is already running get the
+    stale value rather than waiting on the network.
+    """
+
+    def __init__(
+        self, fetch: Callable[[], Awaitable[dict[str, Any]]], ttl: float
+    ) -> None:
+        self._fetch = fetch
+        self._ttl = ttl
+        self._value: dict[str, Any] | None = None
+        self._fetched_at = 0.0
+        self._generation = 0
+        self._inflight: asyncio.Task | None = None
+
+    def invalidate(self) -> None:
+        """Discard the cached value so the next read fetches a fresh status."""
+        self._value = None
+        self._generation += 1
+        self._inflight = None
+
+    async def get(self) -> dict[str, Any]:
+        """Return the cached status, fetching it if it has expired."""
+        if self._value is not None and time.monotonic() - self._fetched_at < self._ttl:
+            return self._value
+
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._refresh(self._generation))
+        elif self._value is not None:
+            return self._value
+
+        return await asyncio.shield(self._inflight)
+
+    async def _refresh(self, generation: int) -> dict[str, Any]:
+        value = await self._fetch()
+        # Responses started before an invalidate() may predate a command
+        if generation == self._generation:
+            self._value = value
+            self._fetched_at = time.monotonic()
+        return value
+
 
 class Device(PollingDevice):
     """
     Device class for the Channels app.
 
     Uses the ChannelsClient to communicate with the Channels HTTP API.
-    Polls the device every POLL_INTERVAL seconds to keep state up to date.
+    Polls the device every POLL_INTERVAL seconds to keep state up to date,
+    speeding up while the user is interacting with playback and slowing down
+    while the app is stopped or unreachable.
     State is stored in dicts keyed by device identifier and propagated to
     entities via push_update() / sync_state().
     """
 
+    connector: aiohttp.BaseConnector | None = None
+    """Connection pool shared by all devices, assigned by the driver at startup."""
+
     def __init__(
         self,
         device_config: DeviceConfig,
@@ -63,9 +143,24 @@ class Device(PollingDevice):
         )
 
         self._client = ChannelsClient(
-            host=device_config.address, port=device_config.port
+            host=device_config.address,
+            port=device_config.port,
+            connector=self.connector,
         )
 
+        self._status_cache = _StatusCache(self._client.status, STATUS_CACHE_TTL)
+        self._command_lock = asyncio.Lock()
+        self._last_command_at: float | None = None
+        self._poll_handle: asyncio.TimerHandle | None = None
+        self._repoll = False
+        self._update_scheduled = False
+        self._connected_once = False
+        self._pending_seek_target: int | None = None
+        self._seek_task: asyncio.Task | None = None
+        self._seek_deadline = 0.0
+        self._refresh_handle: asyncio.TimerHandle | None = None
+        self._refresh_task: asyncio.Task | None = None
+
         self._media_player_attributes = MediaPlayerAttributes(
             STATE=None,
             MUTED=None,
@@ -93,6 +188,21 @@ class Device(PollingDevice):
     def log_id(self) -> str:
         return self.name if self.name else self.identifier
 
+    def push_update(self) -> None:
+        """
+        Notify subscribed entities that the device state has changed.
+
+        Updates pushed during the same event loop iteration are merged into a
+        single UPDATE event, so entities sync once per batch of changes.
+        """
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            self._loop.call_soon(self._emit_update)
+
+    def _emit_update(self) -> None:
+        self._update_scheduled = False
+        super().push_update()
+
     def get_media_player_attributes(self) -> MediaPlayerAttributes:
         """Return current media player attributes."""
         return self._media_player_attributes
@@ -101,35 +211,129 @@ class Device(PollingDevice):
         _LOG.debug(
             "[%s] Establishing connection to Channels at %s", self.log_id, self.address
         )
-        status = await self._client.status()
+        status = await self._status_cache.get()
         if status.get("status") == "offline":
             raise ConnectionError(
                 f"Channels app at {self.address} is offline or unreachable"
             )
-        self._update_state_from_status(status)
-        self.push_update()
-        _LOG.info(
-            "[%s] Connected to Channels app, status: %s",
-            self.log_id,
-            status.get("status"),
-        )
+        if self._update_state_from_status(status):
+            self.push_update()
+        # Only the first connection is worth reporting at INFO; reconnects
+        # after the app was closed or unreachable are routine
+        if self._connected_once:
+            _LOG.debug(
+                "[%s] Reconnected to Channels app, status: %s",
+                self.log_id,
+                status.get("status"),
+            )
+        else:
+            self._connected_once = True
+            _LOG.info(
+                "[%s] Connected to Channels app, status: %s",
+                self.log_id,
+                status.get("status"),
+            )
+
+    @property
+    def is_connected(self) -> bool:
+        if self._stop_polling.is_set():
+            return False
+        if self._poll_handle is not None:
+            return True
+        return self._poll_task is not None and not self._poll_task.done()
+
+    async def connect(self) -> bool:
+        # Between polls the poll task has finished, so the base class check for
+        # a running task is not enough to detect an existing connection
+        if self.is_connected:
+            return True
+        return await super().connect()
+
+    async def disconnect(self) -> None:
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._poll_handle is not None:
+            self._poll_handle.cancel()
+            self._poll_handle = None
+        if self._seek_task is not None:
+            self._seek_task.cancel()
+            self._seek_task = None
+        self._pending_seek_target = None
+        await super().disconnect()
+        await self._client.close()
+
+    async def _poll_loop(self) -> None:
+        """
+        Poll the device once and schedule the next poll.
+
+        Replaces the base loop: the next poll is scheduled with call_later, so
+        only a timer handle is kept between polls instead of a suspended
+        coroutine, and a pending poll can be brought forward after a command.
+        """
+        self._repoll = False
+        try:
+            await self.poll_device()
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            _LOG.error("[%s] Poll error: %s", self.log_id, err)
+
+        if not self._stop_polling.is_set():
+            delay = 0 if self._repoll else self._poll_interval
+            self._poll_handle = self._loop.call_later(delay, self._start_poll)
+
+    def _start_poll(self) -> None:
+        self._poll_handle = None
+        self._poll_task = self._loop.create_task(self._poll_loop())
+
+    def _update_poll_interval(self) -> None:
+        state = self._media_player_attributes.STATE
+        if state in (media_player.States.OFF, media_player.States.UNAVAILABLE):
+            self._poll_interval = POLL_INTERVAL_IDLE
+        elif (
+            state == media_player.States.PLAYING
+            and self._last_command_at is not None
+            and time.monotonic() - self._last_command_at < ACTIVE_WINDOW
+        ):
+            self._poll_interval = POLL_INTERVAL_ACTIVE
+        else:
+            self._poll_interval = POLL_INTERVAL
 
     async def poll_device(self) -> None:
         try:
-            status = await self._client.status()
+            status = await self._status_cache.get()
             if status.get("status") == "offline":
                 _LOG.warning("[%s] Channels app is offline", self.log_id)
-                self._media_player_attributes.STATE = media_player.States.UNAVAILABLE
+                changed = self._set_state(media_player.States.UNAVAILABLE)
             else:
-                self._update_state_from_status(status)
+                changed = self._update_state_from_status(status)
         except Exception as err:  # pylint: disable=broad-exception-caught
             _LOG.error("[%s] Error polling Channels app: %s", self.log_id, err)
-            self._media_player_attributes.STATE = media_player.States.UNAVAILABLE
+            changed = self._set_state(media_player.States.UNAVAILABLE)
+
+        self._update_poll_interval()
+        if changed:
+            self.push_update()
+
+    def _set_state(self, state: media_player.States) -> bool:
+        """Set the media player state, returning True if it changed."""
+        if self._media_player_attributes.STATE == state:
+            return False
+        self._media_player_attributes.STATE = state
+        return True
 
-        self.push_update()
+    def _update_state_from_status(self, status: dict[str, Any]) -> bool:
+        """
+        Build media player attributes from a Channels status response.
 
-    def _update_state_from_status(self, status: dict[str, Any]) -> None:
-        attrs = self._media_player_attributes
+        The attributes are only replaced when they differ from the current
+        ones, so an unchanged status does not trigger an entity update.
+
+        :return: True if any attribute changed
+        """
+        attrs = MediaPlayerAttributes()
 
         channels_status = status.get("status", "stopped")
         attrs.STATE = _CHANNELS_STATE_MAP.get(
@@ -144,11 +348,8 @@ class Device(PollingDevice):
         channel = status.get("channel")
 
         if now_playing:
-            content_type = now_playing.get("type", "")
-            attrs.MEDIA_TYPE = (
-                media_player.MediaType.VIDEO
-                if content_type == "movie"
-                else media_player.MediaType.TVSHOW
+            attrs.MEDIA_TYPE = _MEDIA_TYPE_MAP.get(
+                now_playing.get("type"), media_player.MediaType.TVSHOW
             )
 
             title = now_playing.get("title")
@@ -185,70 +386,131 @@ class Device(PollingDevice):
             attrs.MEDIA_IMAGE_URL = None
             attrs.MEDIA_DURATION = None
 
+        if attrs == self._media_player_attributes:
+            return False
+        self._media_player_attributes = attrs
+        return True
+
+    async def _send_command(self, command: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Send a command to the Channels app and schedule a status refresh.
+
+        Commands are sent one at a time so rapid presses reach the app in order
+        over the same keep-alive connection. The refresh is debounced: every
+        command pushes it back, so a burst of presses is followed by a single
+        status request instead of one per press.
+        """
+        async with self._command_lock:
+            await command()
+        self._status_cache.invalidate()
+        self._last_command_at = time.monotonic()
+
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+        self._refresh_handle = self._loop.call_later(
+            COMMAND_REFRESH_DELAY, self._start_refresh
+        )
+
+    def _start_refresh(self) -> None:
+        self._refresh_handle = None
+        if self._poll_handle is not None:
+            # Poll now rather than waiting out the current interval
+            self._poll_handle.cancel()
+            self._start_poll()
+        elif self.is_connected:
+            # The poll in flight may predate the command, so poll again after it
+            self._repoll = True
+        elif self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = self._loop.create_task(self.poll_device())
+
     async def play_pause(self) -> None:
         _LOG.debug("[%s] Toggle play/pause", self.log_id)
-        await self._client.toggle_pause()
+        await self._send_command(self._client.toggle_pause)
 
     async def pause(self) -> None:
         _LOG.debug("[%s] Pause", self.log_id)
-        await self._client.pause()
+        await self._send_command(self._client.pause)
 
     async def play(self) -> None:
         _LOG.debug("[%s] Resume", self.log_id)
-        await self._client.resume()
+        await self._send_command(self._client.resume)
 
     async def stop(self) -> None:
         _LOG.debug("[%s] Stop", self.log_id)
-        await self._client.stop()
+        await self._send_command(self._client.stop)
 
     async def mute_toggle(self) -> None:
         _LOG.debug("[%s] Toggle mute", self.log_id)
-        await self._client.toggle_mute()
+        await self._send_command(self._client.toggle_mute)
 
     async def channel_up(self) -> None:
         _LOG.debug("[%s] Channel up", self.log_id)
-        await self._client.channel_up()
+        await self._send_command(self._client.channel_up)
 
     async def channel_down(self) -> None:
         _LOG.debug("[%s] Channel down", self.log_id)
-        await self._client.channel_down()
+        await self._send_command(self._client.channel_down)
 
     async def previous_channel(self) -> None:
         _LOG.debug("[%s] Previous channel", self.log_id)
-        await self._client.previous_channel()
+        await self._send_command(self._client.previous_channel)
 
     async def seek_forward(self) -> None:
         _LOG.debug("[%s] Seek forward", self.log_id)
-        await self._client.seek_forward()
+        await self._send_command(self._client.seek_forward)
 
     async def seek_backward(self) -> None:
         _LOG.debug("[%s] Seek backward", self.log_id)
-        await self._client.seek_backward()
+        await self._send_command(self._client.seek_backward)
 
     async def skip_forward(self) -> None:
         _LOG.debug("[%s] Skip forward", self.log_id)
-        await self._client.skip_forward()
+        await self._send_command(self._client.skip_forward)
 
     async def skip_backward(self) -> None:
         _LOG.debug("[%s] Skip backward", self.log_id)
-        await self._client.skip_backward()
+        await self._send_command(self._client.skip_backward)
 
     async def seek(self, position: int) -> None:
         _LOG.debug("[%s] Seek to %s seconds", self.log_id, position)
-        attrs = self._media_player_attributes
-        current = attrs.MEDIA_POSITION or 0
-        delta = position - current
-        if delta != 0:
-            await self._client.seek(delta)
+        self._pending_seek_target = position
+        self._seek_deadline = self._loop.time() + SEEK_DEBOUNCE
+        if self._seek_task is None or self._seek_task.done():
+            self._seek_task = self._loop.create_task(self._flush_seek())
+
+    async def _flush_seek(self) -> None:
+        """
+        Send the latest requested seek once seek requests stop arriving.
+
+        Every seek() pushes the deadline back, so the wait only ends after
+        SEEK_DEBOUNCE seconds without a new request.
+        """
+        while self._pending_seek_target is not None:
+            while (remaining := self._seek_deadline - self._loop.time()) > 0:
+                await asyncio.sleep(remaining)
+            position = self._pending_seek_target
+            self._pending_seek_target = None
+
+            delta = position - (self._media_player_attributes.MEDIA_POSITION or 0)
+            if delta == 0:
+                continue
+            try:
+                await self._send_command(partial(self._client.seek, delta))
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                _LOG.error("[%s] Error seeking: %s", self.log_id, err)
+                continue
+            # Later seeks are relative to this one until the next poll. A poll
+            # may have replaced the attributes while the command was in flight
+            self._media_player_attributes.MEDIA_POSITION = position
 
     async def toggle_cc(self) -> None:
         _LOG.debug("[%s] Toggle closed captions", self.log_id)
-        await self._client.toggle_cc()
+        await self._send_command(self._client.toggle_cc)
 
     async def toggle_pip(self) -> None:
         _LOG.debug("[%s] Toggle picture in picture", self.log_id)
-        await self._client.toggle_pip()
+        await self._send_command(self._client.toggle_pip)
 
     async def toggle_record(self) -> None:
         _LOG.debug("[%s] Toggle record", self.log_id)
-        await self._client.toggle_record()
+        await self._send_command(self._client.toggle_record)
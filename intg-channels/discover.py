@@ -11,6 +11,7 @@ _channels_app._tcp.
 import logging
 from typing import Any
 
+from const import make_identifier
 from ucapi_framework import DiscoveredDevice
 from ucapi_framework.discovery import MDNSDiscovery
 
@@ -34,11 +35,15 @@ class DeviceDiscovery(MDNSDiscovery):
         :param service_info: zeroconf ServiceInfo object
         :return: DiscoveredDevice or None if parsing fails
         """
+        debug = _LOG.isEnabledFor(logging.DEBUG)
         try:
             # Get IP address from service info
             addresses = service_info.parsed_addresses()
             if not addresses:
-                _LOG.debug("Skipping service with no addresses: %s", service_info.name)
+                if debug:
+                    _LOG.debug(
+                        "Skipping service with no addresses: %s", service_info.name
+                    )
                 return None
 
             address = addresses[0]
@@ -49,16 +54,17 @@ class DeviceDiscovery(MDNSDiscovery):
             name = raw_name.split(".")[0] if "." in raw_name else raw_name
 
             # Use address as identifier (stable across restarts)
-            identifier = address.replace(".", "_")
+            identifier = make_identifier(address)
 
             port = service_info.port or CHANNELS_DEFAULT_PORT
 
-            _LOG.debug(
-                "Discovered Channels app: name=%s, address=%s, port=%d",
-                name,
-                address,
-                port,
-            )
+            if debug:
+                _LOG.debug(
+                    "Discovered Channels app: name=%s, address=%s, port=%d",
+                    name,
+                    address,
+                    port,
+                )
 
             return DiscoveredDevice(
                 identifier=identifier,
@@ -11,6 +11,7 @@ import asyncio
 import logging
 import os
 
+import aiohttp
 from const import DeviceConfig
 from device import Device
 from media_player import ChannelsMediaPlayer
@@ -22,14 +23,21 @@ async def main():
     """Start the Channels app Remote integration driver."""
     logging.basicConfig()
 
-    level = os.getenv("UC_LOG_LEVEL", "DEBUG").upper()
+    level = os.getenv("UC_LOG_LEVEL", "INFO").upper()
     logging.getLogger("driver").setLevel(level)
     logging.getLogger("media_player").setLevel(level)
     logging.getLogger("device").setLevel(level)
     logging.getLogger("setup").setLevel(level)
 
+    # One connection pool for all configured devices
+    Device.connector = aiohttp.TCPConnector(
+        limit=32, limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=75
+    )
+
     driver = BaseIntegrationDriver(
-        device_class=Device, entity_classes=[ChannelsMediaPlayer]
+        device_class=Device,
+        entity_classes=[ChannelsMediaPlayer],
+        loop=asyncio.get_running_loop(),
     )
 
     driver.config_manager = BaseConfigManager(
@@ -45,7 +53,10 @@ async def main():
 
     await driver.api.init("driver.json", setup_handler)
 
-    await asyncio.Future()
+    try:
+        await asyncio.Future()
+    finally:
+        await Device.connector.close()
 
 
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ channel up/down, mute, and media metadata.
 """
 
 import logging
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import ucapi
 from ucapi import media_player, EntityTypes
@@ -39,6 +39,22 @@ FEATURES = [
     Features.CHANNEL_SWITCHER,
 ]
 
+_SIMPLE_COMMAND_VALUES: tuple[str, ...] = tuple(
+    member.value for member in SimpleCommands
+)
+
+# Attributes reported before the first status poll; copied per entity
+_INITIAL_ATTRIBUTES: dict[str, Any] = {
+    Attributes.STATE: media_player.States.UNKNOWN,
+    Attributes.MUTED: False,
+    Attributes.MEDIA_TYPE: None,
+    Attributes.MEDIA_TITLE: None,
+    Attributes.MEDIA_ARTIST: None,
+    Attributes.MEDIA_IMAGE_URL: None,
+    Attributes.MEDIA_POSITION: None,
+    Attributes.MEDIA_DURATION: None,
+}
+
 
 class ChannelsMediaPlayer(MediaPlayerEntity):
     """
@@ -48,6 +64,27 @@ class ChannelsMediaPlayer(MediaPlayerEntity):
     subscribe_to_device() and syncs state through sync_state().
     """
 
+    # Commands that map directly onto a parameterless device method
+    _DISPATCH: dict[str, Callable[[device.Device], Awaitable[None]]] = {
+        Commands.PLAY_PAUSE: device.Device.play_pause,
+        Commands.STOP: device.Device.stop,
+        # Next = channel up
+        Commands.NEXT: device.Device.channel_up,
+        # Previous = previous channel (last watched)
+        Commands.PREVIOUS: device.Device.previous_channel,
+        Commands.FAST_FORWARD: device.Device.skip_forward,
+        Commands.REWIND: device.Device.skip_backward,
+        Commands.MUTE_TOGGLE: device.Device.mute_toggle,
+        Commands.CHANNEL_UP: device.Device.channel_up,
+        Commands.CHANNEL_DOWN: device.Device.channel_down,
+        # Simple commands
+        SimpleCommands.TOGGLE_CC: device.Device.toggle_cc,
+        SimpleCommands.TOGGLE_PIP: device.Device.toggle_pip,
+        SimpleCommands.TOGGLE_RECORD: device.Device.toggle_record,
+        SimpleCommands.SEEK_FORWARD: device.Device.seek_forward,
+        SimpleCommands.SEEK_BACKWARD: device.Device.seek_backward,
+    }
+
     def __init__(self, config_device: DeviceConfig, device_instance: device.Device):
         self._device = device_instance
         entity_id = create_entity_id(EntityTypes.MEDIA_PLAYER, config_device.identifier)
@@ -58,21 +95,10 @@ class ChannelsMediaPlayer(MediaPlayerEntity):
             entity_id,
             config_device.name,
             FEATURES,
-            attributes={
-                Attributes.STATE: media_player.States.UNKNOWN,
-                Attributes.MUTED: False,
-                Attributes.MEDIA_TYPE: None,
-                Attributes.MEDIA_TITLE: None,
-                Attributes.MEDIA_ARTIST: None,
-                Attributes.MEDIA_IMAGE_URL: None,
-                Attributes.MEDIA_POSITION: None,
-                Attributes.MEDIA_DURATION: None,
-            },
+            attributes=_INITIAL_ATTRIBUTES.copy(),
             device_class=DeviceClasses.SET_TOP_BOX,
             options={
-                media_player.Options.SIMPLE_COMMANDS: [
-                    member.value for member in SimpleCommands
-                ]
+                media_player.Options.SIMPLE_COMMANDS: list(_SIMPLE_COMMAND_VALUES)
             },
             cmd_handler=self.handle_command,
         )
@@ -98,63 +124,20 @@ class ChannelsMediaPlayer(MediaPlayerEntity):
         _LOG.info("Received command: %s %s", cmd_id, params if params else "")
 
         try:
-            match cmd_id:
-                case Commands.PLAY_PAUSE:
-                    await self._device.play_pause()
-
-                case Commands.STOP:
-                    await self._device.stop()
-
-                case Commands.NEXT:
-                    # Next = channel up
-                    await self._device.channel_up()
-
-                case Commands.PREVIOUS:
-                    # Previous = previous channel (last watched)
-                    await self._device.previous_channel()
-
-                case Commands.FAST_FORWARD:
-                    await self._device.skip_forward()
-
-                case Commands.REWIND:
-                    await self._device.skip_backward()
-
-                case Commands.MUTE_TOGGLE:
-                    await self._device.mute_toggle()
-
-                case Commands.SEEK:
-                    position = params.get("media_position") if params else None
-                    if position is not None:
-                        await self._device.seek(int(position))
-                    else:
-                        _LOG.warning("SEEK command missing media_position param")
-                        return ucapi.StatusCodes.BAD_REQUEST
-
-                case Commands.CHANNEL_UP:
-                    await self._device.channel_up()
-
-                case Commands.CHANNEL_DOWN:
-                    await self._device.channel_down()
-
-                # Simple commands
-                case SimpleCommands.TOGGLE_CC:
-                    await self._device.toggle_cc()
-
-                case SimpleCommands.TOGGLE_PIP:
-                    await self._device.toggle_pip()
-
-                case SimpleCommands.TOGGLE_RECORD:
-                    await self._device.toggle_record()
-
-                case SimpleCommands.SEEK_FORWARD:
-                    await self._device.seek_forward()
-
-                case SimpleCommands.SEEK_BACKWARD:
-                    await self._device.seek_backward()
-
-                case _:
-                    _LOG.warning("Unhandled command: %s", cmd_id)
-                    return ucapi.StatusCodes.NOT_IMPLEMENTED
+            handler = self._DISPATCH.get(cmd_id)
+            if handler is not None:
+                await handler(self._device)
+
+            elif cmd_id == Commands.SEEK:
+                position = params.get("media_position") if params else None
+                if position is None:
+                    _LOG.warning("SEEK command missing media_position param")
+                    return ucapi.StatusCodes.BAD_REQUEST
+                await self._device.seek(int(position))
+
+            else:
+                _LOG.warning("Unhandled command: %s", cmd_id)
+                return ucapi.StatusCodes.NOT_IMPLEMENTED
 
             return ucapi.StatusCodes.OK
 
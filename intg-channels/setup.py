@@ -7,16 +7,153 @@ fallback to manual IP address entry.
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+import asyncio
+import ipaddress
 import logging
+import re
+import socket
+import time
 from typing import Any
 
+import aiohttp
 from api import ChannelsClient
-from const import DEFAULT_PORT, DeviceConfig
+from const import DEFAULT_PORT, DeviceConfig, make_identifier
+from device import Device
 from ucapi import IntegrationSetupError, RequestUserInput, SetupError
 from ucapi_framework import BaseSetupFlow
 
 _LOG = logging.getLogger(__name__)
 
+# Loose hostname check used when the address is not an IP literal
+_HOSTNAME_RE = re.compile(r"[A-Za-z0-9.-]{1,253}")
+
+# Maximum length of a single hostname label (RFC 1035)
+_MAX_LABEL_LENGTH = 63
+
+# Upper bound (in seconds) on the connection check, including retries
+QUERY_TIMEOUT = 5.0
+
+# How long (in seconds) a resolved hostname is reused by later setup attempts
+RESOLVE_CACHE_TTL = 60.0
+
+# Resolved setup hostnames, as address -> (IPv4 address, resolved at)
+_RESOLVE_CACHE: dict[str, tuple[str, float]] = {}
+
+# Timeout (in seconds) for the TCP reachability probe run before the status check
+PROBE_TIMEOUT = 2.0
+
+# The manual entry form is static, so it is built once and reused
+_MANUAL_ENTRY_FORM = RequestUserInput(
+    {"en": "Channels App Setup"},
+    [
+        {
+            "id": "info",
+            "label": {"en": "Connect to Channels App"},
+            "field": {
+                "label": {
+                    "value": {
+                        "en": (
+                            "Enter the IP address of the Apple TV, NVIDIA SHIELD, or other "
+                            "device running the Channels client app — not the Channels DVR server. "
+                            "The app must be open and reachable on port 57000."
+                        ),
+                    }
+                }
+            },
+        },
+        {
+            "field": {"text": {"value": ""}},
+            "id": "address",
+            "label": {"en": "IP Address"},
+        },
+        {
+            "field": {"number": {"value": DEFAULT_PORT, "min": 1, "max": 65535}},
+            "id": "port",
+            "label": {"en": "Port (optional)"},
+        },
+        {
+            "field": {"text": {"value": ""}},
+            "id": "name",
+            "label": {"en": "Device Name (optional)"},
+        },
+    ],
+)
+
+
+def _is_valid_address(address: str) -> bool:
+    """
+    Return True if address is an IPv4 address or a plausible hostname.
+
+    IPv6 literals are rejected: the API client builds plain http://host:port
+    URLs, which cannot carry them.
+    """
+    try:
+        return ipaddress.ip_address(address).version == 4
+    except ValueError:
+        pass
+
+    if _HOSTNAME_RE.fullmatch(address) is None:
+        return False
+    # Empty or overlong labels fail IDNA encoding when the name is resolved
+    return all(
+        0 < len(label) <= _MAX_LABEL_LENGTH
+        for label in address.removesuffix(".").split(".")
+    )
+
+
+async def _resolve(address: str, port: int) -> str:
+    """
+    Resolve address to an IPv4 address, reusing recent results.
+
+    IP literals are returned unchanged.
+
+    :raises OSError: If the hostname cannot be resolved
+    """
+    try:
+        ipaddress.ip_address(address)
+        return address
+    except ValueError:
+        pass
+
+    now = time.monotonic()
+    cached = _RESOLVE_CACHE.get(address)
+    if cached is not None and now - cached[1] < RESOLVE_CACHE_TTL:
+        return cached[0]
+
+    infos = await asyncio.get_running_loop().getaddrinfo(
+        address, port, family=socket.AF_INET, type=socket.SOCK_STREAM
+    )
+    resolved = infos[0][4][0]
+
+    for key in [
+        k for k, (_, at) in _RESOLVE_CACHE.items() if now - at >= RESOLVE_CACHE_TTL
+    ]:
+        del _RESOLVE_CACHE[key]
+    _RESOLVE_CACHE[address] = (resolved, now)
+    return resolved
+
+
+async def _tcp_probe(host: str, port: int, timeout: float = PROBE_TIMEOUT) -> None:
+    """
+    Open and close a TCP connection to check that host:port is reachable.
+
+    :raises OSError: If the connection is refused or fails
+    :raises TimeoutError: If no connection is established within timeout
+    """
+    _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    writer.close()
+    await writer.wait_closed()
+
+
+def _parse_port(value: Any) -> int:
+    """Return value as a valid port number, falling back to DEFAULT_PORT."""
+    if not isinstance(value, int):
+        try:
+            value = int(value)
+        except (ValueError, TypeError):
+            return DEFAULT_PORT
+    return value if 1 <= value <= 65535 else DEFAULT_PORT
+
 
 class DeviceSetupFlow(BaseSetupFlow[DeviceConfig]):
     """
@@ -31,43 +168,7 @@ class DeviceSetupFlow(BaseSetupFlow[DeviceConfig]):
 
         IP address is required; port defaults to 57000 and name is optional.
         """
-        return RequestUserInput(
-            {"en": "Channels App Setup"},
-            [
-                {
-                    "id": "info",
-                    "label": {"en": "Connect to Channels App"},
-                    "field": {
-                        "label": {
-                            "value": {
-                                "en": (
-                                    "Enter the IP address of the Apple TV, NVIDIA SHIELD, or other "
-                                    "device running the Channels client app — not the Channels DVR server. "
-                                    "The app must be open and reachable on port 57000."
-                                ),
-                            }
-                        }
-                    },
-                },
-                {
-                    "field": {"text": {"value": ""}},
-                    "id": "address",
-                    "label": {"en": "IP Address"},
-                },
-                {
-                    "field": {
-                        "number": {"value": DEFAULT_PORT, "min": 1, "max": 65535}
-                    },
-                    "id": "port",
-                    "label": {"en": "Port (optional)"},
-                },
-                {
-                    "field": {"text": {"value": ""}},
-                    "id": "name",
-                    "label": {"en": "Device Name (optional)"},
-                },
-            ],
-        )
+        return _MANUAL_ENTRY_FORM
 
     async def query_device(
         self, input_values: dict[str, Any]
@@ -80,25 +181,44 @@ class DeviceSetupFlow(BaseSetupFlow[DeviceConfig]):
         """
         address = input_values.get("address", "").strip()
         name = input_values.get("name", "").strip()
-        try:
-            port = int(input_values.get("port", DEFAULT_PORT))
-        except (ValueError, TypeError):
-            port = DEFAULT_PORT
+        port = _parse_port(input_values.get("port", DEFAULT_PORT))
 
-        if not address:
-            _LOG.warning("No address provided, re-displaying form")
+        if not _is_valid_address(address):
+            _LOG.warning("Missing or invalid address %r, re-displaying form", address)
             return self.get_manual_entry_form()
 
+        return await self._query_address(address, port, name)
+
+    async def _query_address(
+        self, address: str, port: int, name: str
+    ) -> DeviceConfig | SetupError:
+        """Check that the Channels app answers at address:port."""
         if not name:
             name = f"Channels ({address})"
 
-        _LOG.debug("Attempting to connect to Channels app at %s:%d", address, port)
+        debug = _LOG.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOG.debug("Attempting to connect to Channels app at %s:%d", address, port)
 
+        # Resolve once so the probe and the status check don't each look the
+        # name up; a bare TCP connect then fails fast for offline hosts
         try:
-            client = ChannelsClient(host=address, port=port)
-            status = await client.status()
+            host = await _resolve(address, port)
+            if debug and host != address:
+                _LOG.debug("Resolved %s to %s", address, host)
+            await _tcp_probe(host, port)
+        except (OSError, TimeoutError, UnicodeError) as ex:
+            _LOG.error("Channels app at %s:%d is not reachable: %s", address, port, ex)
+            return SetupError(IntegrationSetupError.CONNECTION_REFUSED)
 
-            if status.get("status") == "offline":
+        # Use the driver's shared pool so repeated attempts reuse keep-alive
+        # connections; closing the client leaves the pool open
+        client = ChannelsClient(host=host, port=port, connector=Device.connector)
+        try:
+            async with asyncio.timeout(QUERY_TIMEOUT):
+                status = await client.status()
+
+            if not isinstance(status, dict) or status.get("status") == "offline":
                 _LOG.error(
                     "Channels app at %s:%d is offline or unreachable", address, port
                 )
@@ -111,17 +231,26 @@ class DeviceSetupFlow(BaseSetupFlow[DeviceConfig]):
                 status.get("status"),
             )
 
-            identifier = address.replace(".", "_")
-
             return DeviceConfig(
-                identifier=identifier,
+                identifier=make_identifier(address),
                 name=name,
                 address=address,
                 port=port,
             )
 
-        except Exception as ex:
+        except TimeoutError:
+            _LOG.error(
+                "Timed out connecting to Channels app at %s:%d after %.0fs",
+                address,
+                port,
+                QUERY_TIMEOUT,
+            )
+            return SetupError(IntegrationSetupError.CONNECTION_REFUSED)
+        except (OSError, ValueError, aiohttp.ClientError) as ex:
+            # ValueError covers a response that isn't JSON, e.g. another service
             _LOG.error(
                 "Failed to connect to Channels app at %s:%d: %s", address, port, ex
             )
             return SetupError(IntegrationSetupError.CONNECTION_REFUSED)
+        finally:
+            await client.close()